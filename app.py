@@ -1,187 +1,536 @@
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.cssselect import CSSSelector
 import re
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import json
-import csv
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder/decoder
+    orjson = None
+
+from http_client import SESSION, REQUEST_TIMEOUT, STREAM_CHUNK_SIZE, new_async_session, fetch, stream
+from logging_setup import configure_logging
+import bbc_scraper
+
+logger = logging.getLogger(__name__)
+
+# orjson parses bytes directly, skipping the text decoding step
+json_loads = orjson.loads if orjson is not None else json.loads
 
 # --- Configuration ---
 BASE_CURRENCY = 'GBP'
 TARGET_CURRENCY = 'KES'
-# ExchangeRate-API Open Access Endpoint for Base currency GBP
-API_URL = f"https://open.er-api.com/v6/latest/{BASE_CURRENCY}"
+BOOKS_URL = "http://books.toscrape.com/"
+CATALOGUE_PAGE_URL = "http://books.toscrape.com/catalogue/page-{}.html"
+CATALOGUE_PAGES = 50
+MAX_CONCURRENT_REQUESTS = 10
+# ExchangeRate-API Open Access Endpoint; one request returns every rate for a base currency
+API_URL_TEMPLATE = "https://open.er-api.com/v6/latest/{}"
+API_URL = API_URL_TEMPLATE.format(BASE_CURRENCY)
+RATE_CACHE_FILE = 'rate_cache.json'
+# Every export is derived from the same DataFrame; JSON feeds the mongoimport step
+EXPORT_FORMATS = ('csv', 'json', 'parquet')
 
 # ==============================================================================
 # 1. SCRAPING AND CLEANING (Steps 1 & 2)
 # ==============================================================================
 
-def scrape_products(url="http://books.toscrape.com/"):
-    """Scrapes product name and price from the target website."""
-    product_data = []
+# CSS selectors are translated to XPath once at import time and evaluated in C by
+# lxml, avoiding the per-tag Python wrappers BeautifulSoup would build. Name and
+# price are looked up inside each product card so they can never be mismatched.
+NAME_SEL = CSSSelector('h3 a', translator='html')
+PRICE_SEL = CSSSelector('p.price_color', translator='html')
+
+@dataclass(slots=True)
+class Product:
+    """One scraped product; ``convert_prices`` adds the converted columns to its DataFrame row."""
+    name: str
+    original_currency: str = 'GBP'
+    original_price: float = 0.0
+
+# Anything that is not a digit or decimal point (e.g. the '£' sign) is stripped.
+_PRICE_RE = re.compile(r'[^\d.]')
+# Number of products to scrape from each listing page
+MAX_PRODUCTS = 10
+
+def _is_product_pod(element):
+    return 'product_pod' in (element.get('class') or '').split()
+
+def _extract_product(product):
+    """Returns the raw ``(name, price_text)`` pair for one product card element."""
+    name_tags = NAME_SEL(product)
+    product_name = (name_tags[0].get('title') or "N/A").strip() if name_tags else "N/A"
+    
+    price_tags = PRICE_SEL(product)
+    original_price_str = ''.join(price_tags[0].itertext()).strip() if price_tags else "£0.00"
+    return product_name, original_price_str
+
+def _clean_products(product_names, price_strings):
+    """Builds ``Product`` instances, cleaning all prices in one vectorized pass."""
+    if not product_names:
+        return []
+
+    # Step 2: Clean the prices (remove '£' and convert to float)
+    cleaned_prices = pd.Series(price_strings, dtype=object).str.replace(_PRICE_RE, '', regex=True)
+    # Always float64, even when every price on the page is a whole number
+    original_prices = pd.to_numeric(cleaned_prices, errors='coerce').astype('float64')
+
+    invalid = original_prices.isna()
+    if invalid.any():
+        bad_names = [name for name, is_bad in zip(product_names, invalid) if is_bad]
+        logger.warning("Could not convert price for %s. Using 0.0.", ', '.join(bad_names))
+        original_prices = original_prices.fillna(0.0)
+
+    return [Product(name=name, original_price=price) for name, price in zip(product_names, original_prices.tolist())]
+
+def _new_product_parser():
+    """Incremental HTML parser that only reports finished <article> elements."""
+    return etree.HTMLPullParser(events=('end',), tag='article')
+
+def _read_products(parser, product_names, price_strings):
+    """Moves every finished product card out of ``parser`` into the name/price lists."""
+    for _, element in parser.read_events():
+        if _is_product_pod(element):
+            name, price = _extract_product(element)
+            product_names.append(name)
+            price_strings.append(price)
+        # Drop the parsed subtree so memory stays bounded
+        element.clear()
+
+def _feed_chunk(parser, chunk, product_names, price_strings):
+    """Feeds one body chunk and collects the cards it completed.
+
+    Returns True if the chunk carried any non-whitespace content.
+    """
+    parser.feed(chunk)
+    _read_products(parser, product_names, price_strings)
+    return bool(chunk.strip())
+
+def _has_enough(product_names, limit):
+    return limit is not None and len(product_names) >= limit
+
+def _finish(parser, received, product_names, price_strings):
+    """Flushes what the parser still buffers once the whole body was read.
+
+    A blank body is skipped, since closing an empty parser raises.
+    """
+    if received:
+        parser.close()
+        _read_products(parser, product_names, price_strings)
+
+async def stream_products(session, url, limit=MAX_PRODUCTS):
+    """Downloads a listing page in chunks, parsing product cards as they arrive.
+
+    Parsing overlaps with the download, only one chunk of the body is held at
+    a time, and the transfer stops once ``limit`` products were seen.
+    """
+    product_names = []
+    price_strings = []
+    parser = _new_product_parser()
+    received = False
+
+    async with stream(session, url) as response:
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            received = _feed_chunk(parser, chunk, product_names, price_strings) or received
+            if _has_enough(product_names, limit):
+                break
+        else:
+            _finish(parser, received, product_names, price_strings)
+
+    return _clean_products(product_names[:limit], price_strings[:limit])
 
-    print(f"Attempting to scrape from: {url}")
+def scrape_products(url=BOOKS_URL, limit=MAX_PRODUCTS):
+    """Scrapes product name and price from the target website.
+
+    The body is streamed into the same incremental parser used by ``stream_products``.
+    """
+    logger.info("Attempting to scrape from: %s", url)
+
+    product_names = []
+    price_strings = []
+    parser = _new_product_parser()
+    received = False
     
     try:
         # Step 7: Error handling for connection issues
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        with SESSION.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
 
-    except requests.exceptions.RequestException as e:
-        print(f" Connection Error or Request Failed: {e}")
-        return product_data
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    products = soup.find_all('article', class_='product_pod')
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                received = _feed_chunk(parser, chunk, product_names, price_strings) or received
+                if _has_enough(product_names, limit):
+                    break
+            else:
+                _finish(parser, received, product_names, price_strings)
 
-    # Scrape prices of at least 10 products
-    for product in products[:10]:
-        name_tag = product.find('h3').find('a')
-        product_name = name_tag['title'].strip() if name_tag else "N/A"
-        
-        price_tag = product.find('p', class_='price_color')
-        original_price_str = price_tag.text.strip() if price_tag else "£0.00"
+    except requests.exceptions.RequestException as e:
+        logger.error("Connection Error or Request Failed: %s", e)
+        return []
+    except etree.LxmlError as e:
+        logger.error("Could not parse %s: %s", url, e)
+        return []
 
-        # Step 2: Clean the price (remove '£' and convert to float)
-        cleaned_price_str = re.sub(r'[^\d.]', '', original_price_str)
-        
-        try:
-            original_price_float = float(cleaned_price_str)
-        except ValueError:
-            original_price_float = 0.0
-            print(f" Warning: Could not convert price for {product_name}. Using 0.0.")
-
-        product_data.append({
-            'name': product_name,
-            'original_currency': 'GBP',
-            'original_price': original_price_float
-        })
-
-    print(f" Successfully scraped {len(product_data)} products.")
+    product_data = _clean_products(product_names[:limit], price_strings[:limit])
+    logger.info("Successfully scraped %d products.", len(product_data))
     return product_data
 
 # ==============================================================================
 # 2. CURRENCY CONVERSION (Steps 3 & 4)
 # ==============================================================================
 
-def get_exchange_rate(base_currency, target_currency):
-    """Fetches the latest exchange rate from the API, with error handling."""
-    
-    MOCK_RATE = 175.00 # Fallback rate
-    conversion_rate = MOCK_RATE
-    last_updated_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+MOCK_RATE = 175.00 # Fallback rate
+RATE_MEMO_TTL = 3600 # Seconds an in-process rate lookup stays memoized
 
-    print(f"\nStep 3: Attempting to fetch live rate from {API_URL}...")
+# In-process memo: base currency -> (rates, timestamp, valid_until)
+_RATES_MEMO = {}
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _memoize_rates(base_currency, rates, timestamp, expires_at):
+    """Keeps rates in memory for RATE_MEMO_TTL seconds, but never past the API's next update."""
+    valid_until = min(time.time() + RATE_MEMO_TTL, expires_at)
+    _RATES_MEMO[base_currency] = (dict(rates), timestamp, valid_until)
+
+def _memoized_rates(base_currency):
+    """Returns a copy of the memoized ``(rates, timestamp)`` if still valid, else None."""
+    entry = _RATES_MEMO.get(base_currency)
+    if entry and entry[2] > time.time():
+        return dict(entry[0]), entry[1]
+    return None
+
+def load_cached_rates(base_currency, filename=RATE_CACHE_FILE):
+    """Returns cached ``(rates, timestamp)`` for a base currency if not expired, else None.
+
+    The API only publishes new rates once a day, so reruns within that window
+    can skip the network round-trip entirely.
+    """
+    if not os.path.exists(filename):
+        return None
 
     try:
-        response = requests.get(API_URL, timeout=10)
+        with open(filename, 'r', encoding='utf-8') as cachefile:
+            cache = json.load(cachefile)
+    except (IOError, ValueError) as e:
+        logger.warning("Ignoring unreadable rate cache %s: %s", filename, e)
+        return None
+
+    entry = cache.get(base_currency)
+    if entry and entry.get('expires_at', 0) > time.time():
+        logger.info("Using cached %s rates (valid until %s)", base_currency,
+                    datetime.fromtimestamp(entry['expires_at']).strftime('%Y-%m-%d %H:%M:%S'))
+        _memoize_rates(base_currency, entry['rates'], entry['timestamp'], entry['expires_at'])
+        return entry['rates'], entry['timestamp']
+    return None
+
+def save_cached_rates(base_currency, rates, timestamp, expires_at, filename=RATE_CACHE_FILE):
+    """Writes the rates for one base currency into the on-disk cache, keeping other bases."""
+    cache = {}
+    if os.path.exists(filename):
+        try:
+            with open(filename, 'r', encoding='utf-8') as cachefile:
+                cache = json.load(cachefile)
+        except (IOError, ValueError):
+            cache = {}
+
+    cache[base_currency] = {
+        'rates': rates,
+        'timestamp': timestamp,
+        'expires_at': expires_at,
+    }
+
+    try:
+        with open(filename, 'w', encoding='utf-8') as cachefile:
+            json.dump(cache, cachefile, indent=4)
+    except IOError as e:
+        logger.warning("Could not write rate cache %s: %s", filename, e)
+
+def _rates_from_payload(body):
+    """Returns ``(rates, timestamp)`` from a raw API response body.
+
+    Raises ValueError if the body is not JSON (e.g. an HTML error page) or the
+    request was unsuccessful.
+    """
+    data = json_loads(body)
+    if not isinstance(data, dict):
+        raise ValueError("API response is not a JSON object")
+    if data.get('result') != 'success':
+        raise ValueError(f"API request failed. Message: {data.get('error', 'Unknown Error')}")
+
+    rates = data.get('rates', {})
+    # Add timestamp for when conversion was done
+    last_updated_time = datetime.fromtimestamp(data['time_last_update_unix']).strftime("%Y-%m-%d %H:%M:%S")
+    base_currency = data.get('base_code', BASE_CURRENCY)
+    logger.info("Success! Fetched %d live rates for %s", len(rates), base_currency)
+    save_cached_rates(base_currency, rates, last_updated_time, data['time_next_update_unix'])
+    _memoize_rates(base_currency, rates, last_updated_time, data['time_next_update_unix'])
+    return rates, last_updated_time
+
+def parse_rates(body):
+    """Extracts every rate and the update time from a raw API response body.
+
+    Returns an empty rates dict if the body is unusable, so callers fall back to the mock rate.
+    """
+    try:
+        return _rates_from_payload(body)
+    except (ValueError, KeyError) as e:
+        logger.warning("Unusable API response: %s", e)
+        return {}, _now()
+
+def select_rate(rates, base_currency, target_currency):
+    """Picks one target rate out of a rates dict, falling back to the mock rate."""
+    if target_currency in rates:
+        conversion_rate = rates[target_currency]
+        logger.info("Live 1 %s = %.4f %s", base_currency, conversion_rate, target_currency)
+        return conversion_rate
+
+    logger.warning("Target currency %s not found. Using mock rate: %s", target_currency, MOCK_RATE)
+    return MOCK_RATE
+
+def lookup_cached_rates(base_currency):
+    """Returns ``(rates, timestamp)`` from memory or the disk cache, or None if neither is fresh."""
+    return _memoized_rates(base_currency) or load_cached_rates(base_currency)
+
+def get_all_rates(base_currency):
+    """Fetches every exchange rate for ``base_currency`` in a single API request.
+
+    Returns ``(rates, timestamp)`` where ``rates`` maps currency codes to floats;
+    ``rates`` is empty if the API could not be reached. One response serves any
+    number of target currencies, and repeat calls are served from memory.
+    """
+    cached = lookup_cached_rates(base_currency)
+    if cached:
+        return cached
+
+    api_url = API_URL_TEMPLATE.format(base_currency)
+    logger.info("Step 3: Attempting to fetch live rates from %s...", api_url)
+
+    try:
+        response = SESSION.get(api_url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
-        
-        if data['result'] == 'success':
-            rates = data.get('rates', {})
-            if target_currency in rates:
-                conversion_rate = rates[target_currency]
-                # Add timestamp for when conversion was done
-                last_updated_time = datetime.fromtimestamp(data['time_last_update_unix']).strftime("%Y-%m-%d %H:%M:%S")
-                print(f" Success! Live 1 {BASE_CURRENCY} = {conversion_rate:.4f} {TARGET_CURRENCY}")
-            else:
-                print(f" Warning: Target currency {target_currency} not found. Using mock rate: {MOCK_RATE}")
-        else:
-            print(f" Warning: API request failed. Using mock rate: {MOCK_RATE}. Message: {data.get('error', 'Unknown Error')}")
-            
+        return _rates_from_payload(response.content)
     except requests.exceptions.RequestException as e:
-        print(f" Connection/API Error: {e}. Using mock rate: {MOCK_RATE}")
+        logger.error("Connection/API Error: %s", e)
+    except (ValueError, KeyError) as e:
+        logger.warning("Unusable API response: %s", e)
+
+    return {}, _now()
+
+def get_exchange_rate(base_currency, target_currency):
+    """Fetches the latest exchange rate from the API, with error handling."""
+    rates, timestamp = get_all_rates(base_currency)
+    return select_rate(rates, base_currency, target_currency), timestamp
 
-    return conversion_rate, last_updated_time
+def convert_prices(products_list, rates_info=None):
+    """Converts the prices for all products in the list.
 
-def convert_prices(products_list):
-    """Converts the prices for all products in the list."""
+    Returns the products as a DataFrame with the conversion columns appended,
+    plus the rate timestamp. ``rates_info`` is an optional ``(rates, timestamp)`` pair that was already
+    fetched (e.g. concurrently by ``gather_all``); otherwise the API is queried.
+    """
     
-    rate, timestamp = get_exchange_rate(BASE_CURRENCY, TARGET_CURRENCY)
+    if rates_info is None:
+        rates_info = get_all_rates(BASE_CURRENCY)
+    rates, timestamp = rates_info
+    rate = select_rate(rates, BASE_CURRENCY, TARGET_CURRENCY)
     
     # Step 4: Convert prices and save the data
-    for product in products_list:
-        converted_price = product['original_price'] * rate
+    df = products_to_frame(products_list)
+    df['converted_currency'] = TARGET_CURRENCY
+    # One vectorized multiply over the whole price column
+    df['converted_price'] = np.round(df['original_price'].to_numpy() * rate, 2)
+    df['conversion_rate'] = round(rate, 4)
+    df['conversion_timestamp'] = timestamp
         
-        product['converted_currency'] = TARGET_CURRENCY
-        product['converted_price'] = round(converted_price, 2)
-        product['conversion_rate'] = round(rate, 4)
-        product['conversion_timestamp'] = timestamp
-        
-    return products_list, timestamp
+    return df, timestamp
 
 # ==============================================================================
 # 3. DISPLAY AND SAVE (Steps 5 & 6)
 # ==============================================================================
 
-def display_data_table(data, timestamp):
+def products_to_frame(products):
+    """Builds the one DataFrame that the display and every exporter are derived from."""
+    return pd.DataFrame.from_records([asdict(product) for product in products],
+                                     columns=[field.name for field in fields(Product)])
+
+def display_data_table(df, timestamp):
     """Displays the product data in a readable table format using pandas."""
     
-    print("\n" + "="*80)
-    print("       Product Prices Scraped & Currency Converted (GBP to KES) 🇰🇪")
-    print(f"      Last Conversion Time: {timestamp}")
-    print("="*80)
+    logger.info("\n%s\n"
+                "       Product Prices Scraped & Currency Converted (GBP to KES) 🇰🇪\n"
+                "      Last Conversion Time: %s\n"
+                "%s", "="*80, timestamp, "="*80)
 
-    if not data:
-        print("No data to display.")
+    if df.empty:
+        logger.info("No data to display.")
         return
-
-    df = pd.DataFrame(data)
     
     # Select, rename, and format columns for display
     df_display = df[['name', 'original_price', 'converted_price', 'conversion_rate']].copy()
     df_display.columns = ['Product Name', 'Price (GBP)', 'Price (KES)', 'Rate (1 GBP)']
     df_display.set_index('Product Name', inplace=True)
     
-    df_display['Price (GBP)'] = df_display['Price (GBP)'].apply(lambda x: f"£{x:.2f}")
-    df_display['Price (KES)'] = df_display['Price (KES)'].apply(lambda x: f"KES {x:,.2f}")
+    # Format straight from the underlying float arrays rather than dispatching a lambda per cell via .apply
+    df_display['Price (GBP)'] = [f"£{x:.2f}" for x in df_display['Price (GBP)'].to_numpy()]
+    df_display['Price (KES)'] = [f"KES {x:,.2f}" for x in df_display['Price (KES)'].to_numpy()]
     
-    print(df_display.to_markdown(numalign="left", stralign="left"))
-    print("="*80 + "\n")
+    logger.info("%s\n%s\n", df_display.to_markdown(numalign="left", stralign="left"), "="*80)
 
-def save_to_csv(data, filename='product_prices_converted.csv'):
-    """Saves the list of dictionaries to a CSV file."""
-    if not data:
-        print(f"Cannot save to {filename}: Data list is empty.")
+def save_to_csv(df, filename='product_prices_converted.csv'):
+    """Saves the product DataFrame to a CSV file."""
+    if df.empty:
+        logger.warning("Cannot save to %s: Data list is empty.", filename)
         return
         
-    fieldnames = data[0].keys()
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(data)
-        print(f" Data successfully saved to {filename}")
+        # pandas' C writer replaces the per-row csv.DictWriter loop
+        df.to_csv(filename, index=False, encoding='utf-8')
+        logger.info("Data successfully saved to %s", filename)
     except IOError as e:
-        print(f" I/O Error when writing to CSV: {e}")
+        logger.error("I/O Error when writing to CSV: %s", e)
 
-def save_to_json(data, filename='product_prices_converted.json'):
-    """Saves the list of dictionaries to a JSON file."""
+def save_to_json(df, filename='product_prices_converted.json'):
+    """Saves the product DataFrame to a JSON file as a list of records."""
+    data = df.to_dict(orient='records')
     try:
-        with open(filename, 'w', encoding='utf-8') as jsonfile:
-            json.dump(data, jsonfile, indent=4)
-        print(f" Data successfully saved to {filename}")
+        if orjson is not None:
+            # orjson encodes straight to bytes and is several times faster than json.dump
+            with open(filename, 'wb') as jsonfile:
+                jsonfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filename, 'w', encoding='utf-8') as jsonfile:
+                json.dump(data, jsonfile, indent=4)
+        logger.info("Data successfully saved to %s", filename)
     except IOError as e:
-        print(f" I/O Error when writing to JSON: {e}")
+        logger.error("I/O Error when writing to JSON: %s", e)
+
+def save_to_parquet(df, filename='product_prices_converted.parquet'):
+    """Saves the product DataFrame to a zstd-compressed Parquet file."""
+    if df.empty:
+        logger.warning("Cannot save to %s: Data list is empty.", filename)
+        return
+
+    try:
+        # Columnar binary output: one pass, no per-cell text formatting, much smaller files
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, filename, compression='zstd')
+        logger.info("Data successfully saved to %s", filename)
+    except (IOError, pa.ArrowException) as e:
+        logger.error("Error when writing to Parquet: %s", e)
+
+SAVERS = {
+    'parquet': save_to_parquet,
+    'csv': save_to_csv,
+    'json': save_to_json,
+}
 
 # ==============================================================================
-# 4. MAIN EXECUTION BLOCK
+# 4. CONCURRENT FETCHING
 # ==============================================================================
 
-if __name__ == "__main__":
-    # 1. Execute the scraping
-    scraped_products = scrape_products()
+def catalogue_urls(pages=CATALOGUE_PAGES):
+    """Returns the URLs of the first ``pages`` books.toscrape catalogue pages."""
+    return [CATALOGUE_PAGE_URL.format(i) for i in range(1, pages + 1)]
+
+async def gather_all(book_urls=(BOOKS_URL,), products_per_page=MAX_PRODUCTS):
+    """Fetches every book listing page, the exchange rates and the BBC headline concurrently.
+
+    All requests are issued from a single top-level ``asyncio.gather``. A
+    semaphore caps how many catalogue pages are in flight at once; the rate and
+    BBC requests bypass it so they overlap with the pages. Listing pages and the
+    BBC page are parsed while they stream in. Total wall time is bounded
+    by the slowest batch instead of the sum of all requests.
+    Returns ``(product_data, (rates, timestamp), headline)``.
+    """
+    if len(book_urls) == 1:
+        logger.info("Attempting to scrape from: %s", book_urls[0])
+    else:
+        logger.info("Attempting to scrape %d pages starting at: %s", len(book_urls), book_urls[0])
+    logger.info("Fetching data from: %s", bbc_scraper.URL)
+
+    # Only hit the API when there are no fresh cached rates
+    cached_rates = lookup_cached_rates(BASE_CURRENCY)
+    if not cached_rates:
+        logger.info("Step 3: Attempting to fetch live rates from %s...", API_URL)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def bounded_stream_products(session, url):
+        async with semaphore:
+            return await stream_products(session, url, limit=products_per_page)
+
+    async with new_async_session() as session:
+        # The rate and headline requests go first and are not throttled, so they
+        # start immediately instead of queueing behind the catalogue pages.
+        rate_request = asyncio.sleep(0) if cached_rates else fetch(session, API_URL)
+        rate_body, headline, *pages = await asyncio.gather(
+            rate_request,
+            bbc_scraper.stream_bbc_headline(session),
+            *(bounded_stream_products(session, url) for url in book_urls),
+            return_exceptions=True,
+        )
+
+    # Pages were parsed while they streamed in; failed pages are skipped
+    # so one bad page does not abort the rest of the catalogue.
+    product_data = []
+    for url, page in zip(book_urls, pages):
+        if isinstance(page, etree.LxmlError):
+            logger.error("Could not parse %s: %s", url, page)
+        elif isinstance(page, Exception):
+            logger.error("Connection Error or Request Failed for %s: %r", url, page)
+        else:
+            product_data.extend(page)
+    logger.info("Successfully scraped %d products.", len(product_data))
+
+    if cached_rates:
+        rates_info = cached_rates
+    elif isinstance(rate_body, Exception):
+        logger.error("Connection/API Error: %r", rate_body)
+        rates_info = ({}, _now())
+    else:
+        rates_info = parse_rates(rate_body)
+
+    if isinstance(headline, Exception):
+        logger.error("Error fetching URL: %r", headline)
+        headline = None
+
+    return product_data, rates_info, headline
+
+# ==============================================================================
+# 5. MAIN EXECUTION BLOCK
+# ==============================================================================
+
+def main():
+    # 1. Execute the scraping of the whole catalogue, the rate lookup and the headline fetch concurrently
+    scraped_products, rates_info, headline = asyncio.run(gather_all(catalogue_urls(), products_per_page=None))
+
+    if headline is not None:
+        bbc_scraper.display_headline(headline)
     
     if scraped_products:
-        # 2. Convert Prices
-        final_product_data, final_timestamp = convert_prices(scraped_products)
+        # 2. Convert Prices; the display and every export are derived from this one frame
+        final_df, final_timestamp = convert_prices(scraped_products, rates_info)
         
         # 3. Display Data
-        display_data_table(final_product_data, final_timestamp)
+        display_data_table(final_df, final_timestamp)
 
         # 4. Save Data
-        save_to_csv(final_product_data)
-        save_to_json(final_product_data)
+        for export_format in EXPORT_FORMATS:
+            SAVERS[export_format](final_df)
     else:
-        print("\nScript terminated because no product data was scraped.")
\ No newline at end of file
+        logger.warning("Script terminated because no product data was scraped.")
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
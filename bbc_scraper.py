@@ -1,51 +1,114 @@
 import requests
-from bs4 import BeautifulSoup
+import logging
+import lxml.etree as ET
+
+from http_client import SESSION, REQUEST_TIMEOUT, STREAM_CHUNK_SIZE, stream
+from logging_setup import configure_logging
+
+logger = logging.getLogger(__name__)
 
 # --- 1. The Stable URL ---
 URL = 'https://www.bbc.com/sport/football' 
 
 # -------------------------------------------------------------
-# --- 2. Fetch the HTML Content ---
+# --- 2. Parse the HTML and Extract the Headline ---
 # -------------------------------------------------------------
-print(f"Fetching data from: {URL}")
-try:
-    # Set a User-Agent header
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    response = requests.get(URL, headers=headers)
-    
-    # Check for HTTP errors
-    response.raise_for_status() 
-    
-    html_content = response.text
-    print("Successfully downloaded HTML content.")
-
-except requests.exceptions.RequestException as e:
-    print(f"Error fetching URL: {e}")
-    exit()
+# --- FINAL STRATEGY: Try finding the first <h2> tag on the page. ---
+# Since H3 failed, H2 is the next most likely generic tag for a primary headline.
+# The page is fed to an incremental parser that only reports <h2> elements, so
+# parsing (and, when streaming, downloading) stops at the first </h2>.
+
+def _new_headline_parser():
+    return ET.HTMLPullParser(events=('end',), tag='h2')
+
+def _first_headline(parser):
+    """Returns the text of the first finished <h2> seen by ``parser``, or None."""
+    for _, headline_element in parser.read_events():
+        # Get all the text inside the element and clean up whitespace
+        title = ''.join(headline_element.itertext()).strip()
+        headline_element.clear()
+        return title
+    return None
+
+def _feed_chunk(parser, chunk):
+    """Feeds one body chunk; returns the headline once its </h2> has been parsed, else None."""
+    parser.feed(chunk)
+    return _first_headline(parser)
+
+def _finish(parser, received):
+    """Flushes the parser after the whole body was read, in case the <h2> ended in the last chunk."""
+    if not received:
+        return None
+    parser.close()
+    return _first_headline(parser)
+
+def _warn_if_missing(title):
+    if title is None:
+        logger.warning("Extraction failed. Could not find any <h2> element on the page. "
+                       "The headline may now be in an <h1> or a <span>.")
+    return title
 
 # -------------------------------------------------------------
-# --- 3. Parse the HTML and Extract the Headline ---
+# --- 3. Fetch the HTML Content ---
 # -------------------------------------------------------------
-soup = BeautifulSoup(html_content, 'html.parser')
-
-try:
-    # --- FINAL STRATEGY: Try finding the first <h2> tag on the page. ---
-    # Since H3 failed, H2 is the next most likely generic tag for a primary headline.
-    headline_element = soup.find('h2')
-    
-    if headline_element:
-        # Get all the text inside the element and clean up whitespace
-        title = headline_element.text.strip()
-        
-        print("\n===================================")
-        print(" EXTRACTED HEADLINE:")
-        print(title)
-        print("===================================")
-    else:
-        print("\n Extraction failed. Could not find any <h2> element on the page.")
-        print("   The headline may now be in an <h1> or a <span>.")
-
-except Exception as e:
-    print(f"\nAn error occurred during parsing: {e}")
\ No newline at end of file
+
+def scrape_bbc_headline(session=SESSION):
+    """Streams the BBC football page and returns its headline, or None on failure."""
+    logger.info("Fetching data from: %s", URL)
+    title = None
+    parser = _new_headline_parser()
+    received = False
+    try:
+        with session.get(URL, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            # Check for HTTP errors
+            response.raise_for_status() 
+
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                received = received or bool(chunk.strip())
+                title = _feed_chunk(parser, chunk)
+                if title is not None:
+                    # Skip the rest of the download
+                    break
+            else:
+                title = _finish(parser, received)
+
+    except requests.exceptions.RequestException as e:
+        logger.error("Error fetching URL: %s", e)
+        return None
+    except ET.LxmlError as e:
+        logger.error("An error occurred during parsing: %s", e)
+        return None
+
+    return _warn_if_missing(title)
+
+async def stream_bbc_headline(session):
+    """Async counterpart of ``scrape_bbc_headline`` for a shared httpx client.
+
+    HTTP errors propagate to the caller so they can be reported with the other fetches.
+    """
+    title = None
+    parser = _new_headline_parser()
+    received = False
+    async with stream(session, URL) as response:
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+            received = received or bool(chunk.strip())
+            title = _feed_chunk(parser, chunk)
+            if title is not None:
+                # Skip the rest of the download
+                break
+        else:
+            title = _finish(parser, received)
+    return _warn_if_missing(title)
+
+def display_headline(title):
+    """Logs the extracted headline in a banner."""
+    logger.info("\n===================================\n"
+                " EXTRACTED HEADLINE:\n"
+                "%s\n"
+                "===================================", title)
+
+if __name__ == '__main__':
+    configure_logging()
+    headline = scrape_bbc_headline()
+    if headline is not None:
+        display_headline(headline)
@@ -0,0 +1,113 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
+import asyncio
+import contextlib
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import httpx
+
+# --- Shared HTTP configuration for app.py and bbc_scraper.py ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+REQUEST_TIMEOUT = 10
+# Bytes read per step when a response body is streamed into a parser
+STREAM_CHUNK_SIZE = 8192
+
+# --- Retry policy, shared by the sync and async clients ---
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_BACKOFF_MAX = 120
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# --- Shared HTTP Session ---
+# Reusing one session keeps connections alive between requests, so we only pay
+# the DNS/TCP/TLS setup cost once per host instead of on every call.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+# Transient failures (rate limiting, 5xx) are retried with exponential backoff
+# on the pooled connection instead of falling straight back to mock data.
+RETRY_POLICY = Retry(
+    total=RETRY_TOTAL,
+    backoff_factor=RETRY_BACKOFF_FACTOR,
+    status_forcelist=sorted(RETRY_STATUSES),
+    respect_retry_after_header=True,
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY_POLICY)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+atexit.register(SESSION.close)
+
+# --- Async client ---
+
+def new_async_session(limit=20):
+    """Creates an HTTP/2-enabled httpx client with the shared headers.
+
+    Over HTTPS, concurrent requests to the same host are multiplexed on one
+    TLS connection; plain-HTTP hosts fall back to pooled HTTP/1.1 connections.
+    """
+    # The transport retries failed connection attempts; retryable HTTP statuses
+    # are handled by send_with_retries.
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=limit),
+        retries=RETRY_TOTAL,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        headers={'User-Agent': USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+    )
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying: honours Retry-After, else exponential backoff."""
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            return min(max(0.0, float(retry_after)), RETRY_BACKOFF_MAX)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return min(max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds()), RETRY_BACKOFF_MAX)
+            except (TypeError, ValueError):
+                pass
+    return min(RETRY_BACKOFF_FACTOR * (2 ** attempt), RETRY_BACKOFF_MAX)
+
+async def send_with_retries(session, url, stream=False):
+    """GETs ``url``, retrying transient 429/5xx responses with backoff.
+
+    Returns the successful response (still open if ``stream`` is true) or raises
+    ``httpx.HTTPStatusError`` once retries are exhausted.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        response = await session.send(session.build_request('GET', url), stream=stream)
+        if response.status_code in RETRY_STATUSES and attempt < RETRY_TOTAL:
+            delay = _retry_delay(response, attempt)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            continue
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            await response.aclose()
+            raise
+        return response
+
+async def fetch(session, url):
+    """Downloads a URL with the async client and returns the raw response body."""
+    response = await send_with_retries(session, url)
+    return response.content
+
+@contextlib.asynccontextmanager
+async def stream(session, url):
+    """Opens a streamed GET (with retries) and closes it when the block exits.
+
+    Leaving the block early abandons the rest of the body download.
+    """
+    response = await send_with_retries(session, url, stream=True)
+    try:
+        yield response
+    finally:
+        await response.aclose()
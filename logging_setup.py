@@ -0,0 +1,44 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener = None
+NOISY_LOGGERS = ('httpx', 'httpcore', 'hpack')
+
+class _LevelPrefixFormatter(logging.Formatter):
+    """Plain messages for progress output; 'WARNING: ' / 'ERROR: ' prefixes for anything worse."""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname}: {message}"
+        return message
+
+def configure_logging(level=logging.INFO):
+    """Routes log records through a queue so console writes happen on a background thread.
+
+    Scraping code only enqueues records; a QueueListener does the formatting and
+    stream I/O. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_LevelPrefixFormatter('%(message)s'))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    # httpx/httpcore log every request at INFO; keep the console to our own messages
+    for noisy in NOISY_LOGGERS:
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    # Flush whatever is still queued before the interpreter exits
+    atexit.register(_listener.stop)
+    return _listener